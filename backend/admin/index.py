@@ -1,7 +1,416 @@
 import json
 import os
-import psycopg2
-from psycopg2.extras import RealDictCursor
+from datetime import datetime
+
+STAT_COLUMNS = ('matches_played', 'wins', 'losses', 'draws', 'kills', 'deaths')
+
+TEAM_STATS_UPSERT = """
+    INSERT INTO team_stats (team_id, matches_played, wins, losses, draws, kills, deaths,
+                            current_streak, best_win_streak, last_match_at)
+    VALUES %s
+    ON CONFLICT (team_id) DO UPDATE SET
+        matches_played = team_stats.matches_played + EXCLUDED.matches_played,
+        wins = team_stats.wins + EXCLUDED.wins,
+        losses = team_stats.losses + EXCLUDED.losses,
+        draws = team_stats.draws + EXCLUDED.draws,
+        kills = team_stats.kills + EXCLUDED.kills,
+        deaths = team_stats.deaths + EXCLUDED.deaths,
+        current_streak = CASE
+            WHEN EXCLUDED.wins > 0 THEN GREATEST(team_stats.current_streak, 0) + 1
+            WHEN EXCLUDED.losses > 0 THEN LEAST(team_stats.current_streak, 0) - 1
+            ELSE 0 END,
+        best_win_streak = GREATEST(team_stats.best_win_streak,
+            CASE WHEN EXCLUDED.wins > 0 THEN GREATEST(team_stats.current_streak, 0) + 1 ELSE 0 END),
+        last_match_at = GREATEST(team_stats.last_match_at, EXCLUDED.last_match_at),
+        updated_at = NOW()
+"""
+
+TEAM_TYPE_STATS_UPSERT = """
+    INSERT INTO team_match_type_stats (team_id, match_type, matches_played, wins, losses, draws, kills, deaths)
+    VALUES %s
+    ON CONFLICT (team_id, match_type) DO UPDATE SET
+        matches_played = team_match_type_stats.matches_played + EXCLUDED.matches_played,
+        wins = team_match_type_stats.wins + EXCLUDED.wins,
+        losses = team_match_type_stats.losses + EXCLUDED.losses,
+        draws = team_match_type_stats.draws + EXCLUDED.draws,
+        kills = team_match_type_stats.kills + EXCLUDED.kills,
+        deaths = team_match_type_stats.deaths + EXCLUDED.deaths
+"""
+
+TEAM_HEAD_TO_HEAD_UPSERT = """
+    INSERT INTO team_head_to_head (team_id, opponent_id, matches_played, wins, losses, draws, last_match_at)
+    VALUES %s
+    ON CONFLICT (team_id, opponent_id) DO UPDATE SET
+        matches_played = team_head_to_head.matches_played + EXCLUDED.matches_played,
+        wins = team_head_to_head.wins + EXCLUDED.wins,
+        losses = team_head_to_head.losses + EXCLUDED.losses,
+        draws = team_head_to_head.draws + EXCLUDED.draws,
+        last_match_at = GREATEST(team_head_to_head.last_match_at, EXCLUDED.last_match_at)
+"""
+
+PARTICIPANT_TOTALS = """
+    SELECT mp.match_id, mp.team_id, COALESCE(SUM(mp.kills), 0) AS kills, COALESCE(SUM(mp.deaths), 0) AS deaths
+    FROM match_participants mp
+    JOIN matches m ON m.id = mp.match_id
+    WHERE {where} AND mp.team_id IS NOT NULL AND mp.status <> 'cancelled'
+    GROUP BY mp.match_id, mp.team_id
+"""
+
+def team_results(match: dict) -> list:
+    '''Исходы завершённого матча по командам: (team_id, opponent_id, wins, losses, draws)'''
+    results = []
+    for team_id, opponent_id in ((match['team1_id'], match['team2_id']), (match['team2_id'], match['team1_id'])):
+        if not team_id or team_id == opponent_id:
+            continue
+        if not match['winner_team_id']:
+            outcome = (0, 0, 1)
+        elif match['winner_team_id'] == team_id:
+            outcome = (1, 0, 0)
+        else:
+            outcome = (0, 1, 0)
+        results.append((team_id, opponent_id) + outcome)
+    return results
+
+def write_team_stats(cur, team_rows: list, type_rows: list, h2h_rows: list):
+    from psycopg2.extras import execute_values
+    
+    if team_rows:
+        execute_values(cur, TEAM_STATS_UPSERT, team_rows)
+    if type_rows:
+        execute_values(cur, TEAM_TYPE_STATS_UPSERT, type_rows)
+    if h2h_rows:
+        execute_values(cur, TEAM_HEAD_TO_HEAD_UPSERT, h2h_rows)
+
+def apply_team_stats(cur, match: dict):
+    '''Добавляет результат одного завершённого матча в сводные таблицы статистики команд'''
+    results = team_results(match)
+    if not results:
+        return
+    
+    cur.execute(PARTICIPANT_TOTALS.format(where='m.id = %s'), (match['id'],))
+    totals = {row['team_id']: row for row in cur.fetchall()}
+    
+    team_rows, type_rows, h2h_rows = [], [], []
+    for team_id, opponent_id, wins, losses, draws in results:
+        kills = totals[team_id]['kills'] if team_id in totals else 0
+        deaths = totals[team_id]['deaths'] if team_id in totals else 0
+        streak = 1 if wins else (-1 if losses else 0)
+        team_rows.append((team_id, 1, wins, losses, draws, kills, deaths, streak, wins, match['match_date']))
+        type_rows.append((team_id, match['match_type'], 1, wins, losses, draws, kills, deaths))
+        if opponent_id:
+            h2h_rows.append((team_id, opponent_id, 1, wins, losses, draws, match['match_date']))
+    
+    write_team_stats(cur, team_rows, type_rows, h2h_rows)
+
+def rebuild_team_stats(cur, team_ids: list = None) -> dict:
+    '''Пересчитывает сводные таблицы статистики по завершённым матчам — всех команд или только team_ids'''
+    where = "m.status = 'completed'"
+    params = ()
+    if team_ids is None:
+        cur.execute("TRUNCATE team_stats, team_match_type_stats, team_head_to_head")
+    else:
+        cur.execute("DELETE FROM team_stats WHERE team_id = ANY(%s)", (team_ids,))
+        cur.execute("DELETE FROM team_match_type_stats WHERE team_id = ANY(%s)", (team_ids,))
+        cur.execute("DELETE FROM team_head_to_head WHERE team_id = ANY(%s) OR opponent_id = ANY(%s)", (team_ids, team_ids))
+        where += " AND (m.team1_id = ANY(%s) OR m.team2_id = ANY(%s))"
+        params = (team_ids, team_ids)
+    
+    cur.execute(
+        f"""SELECT m.id, m.match_type, m.match_date, m.team1_id, m.team2_id, m.winner_team_id
+            FROM matches m WHERE {where} ORDER BY m.match_date, m.id""",
+        params
+    )
+    matches = cur.fetchall()
+    
+    cur.execute(PARTICIPANT_TOTALS.format(where=where), params)
+    totals = {(row['match_id'], row['team_id']): row for row in cur.fetchall()}
+    
+    teams, types, h2h = {}, {}, {}
+    for match in matches:
+        for team_id, opponent_id, wins, losses, draws in team_results(match):
+            row = totals.get((match['id'], team_id))
+            values = (1, wins, losses, draws, row['kills'] if row else 0, row['deaths'] if row else 0)
+            
+            stats = teams.setdefault(team_id, dict.fromkeys(STAT_COLUMNS, 0) | {'current_streak': 0, 'best_win_streak': 0})
+            for column, value in zip(STAT_COLUMNS, values):
+                stats[column] += value
+            if wins:
+                stats['current_streak'] = max(stats['current_streak'], 0) + 1
+            elif losses:
+                stats['current_streak'] = min(stats['current_streak'], 0) - 1
+            else:
+                stats['current_streak'] = 0
+            stats['best_win_streak'] = max(stats['best_win_streak'], stats['current_streak'])
+            stats['last_match_at'] = match['match_date']
+            
+            type_stats = types.setdefault((team_id, match['match_type']), dict.fromkeys(STAT_COLUMNS, 0))
+            for column, value in zip(STAT_COLUMNS, values):
+                type_stats[column] += value
+            
+            if opponent_id:
+                pair_stats = h2h.setdefault((team_id, opponent_id), dict.fromkeys(STAT_COLUMNS[:4], 0))
+                for column, value in zip(STAT_COLUMNS[:4], values):
+                    pair_stats[column] += value
+                pair_stats['last_match_at'] = match['match_date']
+    
+    if team_ids is not None:
+        teams = {key: s for key, s in teams.items() if key in team_ids}
+        types = {key: s for key, s in types.items() if key[0] in team_ids}
+    
+    write_team_stats(
+        cur,
+        [(team_id,) + tuple(s[c] for c in STAT_COLUMNS) + (s['current_streak'], s['best_win_streak'], s['last_match_at'])
+         for team_id, s in teams.items()],
+        [key + tuple(s[c] for c in STAT_COLUMNS) for key, s in types.items()],
+        [key + tuple(s[c] for c in STAT_COLUMNS[:4]) + (s['last_match_at'],) for key, s in h2h.items()]
+    )
+    if team_ids is None:
+        cur.execute("UPDATE matches SET stats_applied = (status = 'completed')")
+    
+    return {'teams': len(teams), 'matches': len(matches)}
+
+MAX_BATCH_SIZE = 500
+MAX_INT4 = 2147483647
+
+def valid_int(value, minimum: int = 1) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and minimum <= value <= MAX_INT4
+
+def item_id(item, key: str):
+    value = item.get(key) if isinstance(item, dict) else None
+    return value if valid_int(value) else None
+
+def valid_text(value, max_length: int) -> bool:
+    return isinstance(value, str) and 0 < len(value.strip()) <= max_length
+
+def existing_ids(cur, table: str, ids) -> dict:
+    '''Возвращает {id: name} для существующих записей таблицы одним запросом'''
+    ids = sorted(set(i for i in ids if i))
+    if not ids:
+        return {}
+    column = 'name' if table == 'teams' else 'email'
+    cur.execute(f"SELECT id, {column} AS name FROM {table} WHERE id = ANY(%s)", (ids,))
+    return {row['id']: row['name'] for row in cur.fetchall()}
+
+def batch_ban_players(cur, items: list, admin: dict) -> list:
+    '''Массовая блокировка/разблокировка игроков одним UPDATE'''
+    from psycopg2.extras import execute_values
+    
+    results = [None] * len(items)
+    values = {}
+    for index, item in enumerate(items):
+        player_id = item_id(item, 'player_id')
+        if not player_id:
+            results[index] = {'index': index, 'ok': False, 'error': 'Valid player ID required'}
+            continue
+        banned = item.get('banned', True)
+        if not isinstance(banned, bool):
+            results[index] = {'index': index, 'ok': False, 'error': 'Banned must be a boolean'}
+            continue
+        values[player_id] = banned
+    
+    updated = {}
+    if values:
+        rows = execute_values(
+            cur,
+            """UPDATE users u SET is_banned = v.banned
+               FROM (VALUES %s) AS v(id, banned)
+               WHERE u.id = v.id
+               RETURNING u.id, u.email, u.name, u.is_banned""",
+            list(values.items()),
+            template='(%s::integer, %s::boolean)',
+            page_size=MAX_BATCH_SIZE,
+            fetch=True
+        )
+        updated = {row['id']: dict(row) for row in rows}
+    
+    for index, item in enumerate(items):
+        if results[index] is None:
+            player = updated.get(item['player_id'])
+            results[index] = {'index': index, 'ok': True, 'player': player} if player else {'index': index, 'ok': False, 'error': 'Player not found'}
+    return results
+
+def batch_add_players_to_team(cur, items: list, admin: dict) -> list:
+    '''Массовое добавление игроков в команды: один upsert в team_members и один UPDATE users'''
+    from psycopg2.extras import execute_values
+    
+    teams = existing_ids(cur, 'teams', [item_id(item, 'team_id') for item in items])
+    players = existing_ids(cur, 'users', [item_id(item, 'player_id') for item in items])
+    
+    results = [None] * len(items)
+    members = {}
+    for index, item in enumerate(items):
+        team_id, player_id = item_id(item, 'team_id'), item_id(item, 'player_id')
+        if not team_id or not player_id:
+            results[index] = {'index': index, 'ok': False, 'error': 'Valid team ID and player ID required'}
+        elif team_id not in teams:
+            results[index] = {'index': index, 'ok': False, 'error': 'Team not found'}
+        elif player_id not in players:
+            results[index] = {'index': index, 'ok': False, 'error': 'Player not found'}
+        elif not valid_text(item.get('role', 'member'), 50):
+            results[index] = {'index': index, 'ok': False, 'error': 'Role must be a string of at most 50 characters'}
+        else:
+            members[(team_id, player_id)] = item.get('role', 'member').strip()
+    
+    saved = {}
+    if members:
+        rows = execute_values(
+            cur,
+            """INSERT INTO team_members (team_id, user_id, role) VALUES %s
+               ON CONFLICT (team_id, user_id) DO UPDATE SET role = EXCLUDED.role
+               RETURNING *""",
+            [key + (role,) for key, role in members.items()],
+            page_size=MAX_BATCH_SIZE,
+            fetch=True
+        )
+        saved = {(row['team_id'], row['user_id']): dict(row) for row in rows}
+        
+        user_teams = {player_id: teams[team_id] for team_id, player_id in members}
+        execute_values(
+            cur,
+            "UPDATE users u SET team = v.team FROM (VALUES %s) AS v(id, team) WHERE u.id = v.id",
+            list(user_teams.items()),
+            template='(%s::integer, %s)',
+            page_size=MAX_BATCH_SIZE
+        )
+    
+    for index, item in enumerate(items):
+        if results[index] is None:
+            results[index] = {'index': index, 'ok': True, 'member': saved[(item['team_id'], item['player_id'])]}
+    return results
+
+def match_item_error(item, teams: dict):
+    '''Проверяет элемент batch_create_matches, возвращает текст ошибки или None'''
+    if not isinstance(item, dict):
+        return 'Item must be an object'
+    if not item.get('title') or not item.get('match_date'):
+        return 'Title and match date required'
+    if not valid_text(item['title'], 255):
+        return 'Title must be a string of at most 255 characters'
+    if not valid_text(item.get('match_type', 'Турнир'), 50):
+        return 'Match type must be a string of at most 50 characters'
+    if not isinstance(item['match_date'], str):
+        return 'Invalid match date'
+    try:
+        datetime.fromisoformat(item['match_date'])
+    except ValueError:
+        return 'Invalid match date'
+    if item.get('max_players') is not None and not valid_int(item['max_players']):
+        return 'Max players must be a positive integer'
+    for key in ('team1_id', 'team2_id'):
+        if item.get(key) is not None and not valid_int(item[key]):
+            return 'Team ID must be a positive integer'
+        if item.get(key) is not None and item[key] not in teams:
+            return 'Team not found'
+    return None
+
+def batch_create_matches(cur, items: list, admin: dict) -> list:
+    '''Массовое создание матчей одним INSERT; id выделяются заранее, чтобы сопоставить результаты с элементами'''
+    from psycopg2.extras import execute_values
+    
+    teams = existing_ids(cur, 'teams', [item_id(item, key) for item in items for key in ('team1_id', 'team2_id')])
+    
+    results = [None] * len(items)
+    rows, row_indexes = [], []
+    for index, item in enumerate(items):
+        error = match_item_error(item, teams)
+        if error:
+            results[index] = {'index': index, 'ok': False, 'error': error}
+            continue
+        rows.append((
+            item['title'].strip(), item.get('match_type', 'Турнир').strip(), item['match_date'],
+            item.get('max_players'), item.get('team1_id'), item.get('team2_id'), admin['id']
+        ))
+        row_indexes.append(index)
+    
+    if rows:
+        cur.execute(
+            "SELECT nextval(pg_get_serial_sequence('matches', 'id')) AS id FROM generate_series(1, %s)",
+            (len(rows),)
+        )
+        match_ids = [row['id'] for row in cur.fetchall()]
+        created = execute_values(
+            cur,
+            """INSERT INTO matches (id, title, match_type, match_date, max_players, team1_id, team2_id, created_by)
+               VALUES %s RETURNING *""",
+            [(match_id,) + row for match_id, row in zip(match_ids, rows)],
+            page_size=MAX_BATCH_SIZE,
+            fetch=True
+        )
+        index_by_id = dict(zip(match_ids, row_indexes))
+        for match in created:
+            index = index_by_id[match['id']]
+            results[index] = {'index': index, 'ok': True, 'match': dict(match)}
+    return results
+
+BATCH_ACTIONS = {
+    'batch_ban_players': batch_ban_players,
+    'batch_add_players_to_team': batch_add_players_to_team,
+    'batch_create_matches': batch_create_matches,
+}
+
+SEARCH_MIN_LENGTH = 2
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 50
+SEARCH_MAX_OFFSET = 1000
+
+SEARCH_PLAYERS_SQL = """
+    SELECT id, name, nickname, email, team, rating, matches_played, matches_won, is_banned, is_admin,
+           GREATEST(word_similarity(%(q)s, lower(translate(name, 'Ёё', 'Ее'))),
+                    word_similarity(%(q)s, COALESCE(lower(translate(nickname, 'Ёё', 'Ее')), '')),
+                    word_similarity(%(q)s, email)) AS score
+    FROM users
+    WHERE lower(translate(name, 'Ёё', 'Ее')) LIKE %(pattern)s
+       OR lower(translate(nickname, 'Ёё', 'Ее')) LIKE %(pattern)s
+       OR email LIKE %(pattern)s
+       OR (%(fuzzy)s AND (%(q)s <%% lower(translate(name, 'Ёё', 'Ее'))
+                          OR %(q)s <%% lower(translate(nickname, 'Ёё', 'Ее'))
+                          OR %(q)s <%% email))
+    ORDER BY score DESC, rating DESC, id
+    LIMIT %(limit)s OFFSET %(offset)s
+"""
+
+SEARCH_TEAMS_SQL = """
+    SELECT id, name, description, rating, matches_played, matches_won,
+           word_similarity(%(q)s, lower(translate(name, 'Ёё', 'Ее'))) AS score
+    FROM teams
+    WHERE lower(translate(name, 'Ёё', 'Ее')) LIKE %(pattern)s
+       OR (%(fuzzy)s AND %(q)s <%% lower(translate(name, 'Ёё', 'Ее')))
+    ORDER BY score DESC, rating DESC, id
+    LIMIT %(limit)s OFFSET %(offset)s
+"""
+
+def search_params(query: dict):
+    '''Разбирает параметры поиска из query string; возвращает (params, error)'''
+    q = ' '.join(str(query.get('q', '')).lower().replace('ё', 'е').split())[:100]
+    if len(q) < SEARCH_MIN_LENGTH:
+        return None, f'Search query must be at least {SEARCH_MIN_LENGTH} characters'
+    try:
+        limit = min(max(int(query.get('limit', SEARCH_DEFAULT_LIMIT)), 1), SEARCH_MAX_LIMIT)
+        offset = min(max(int(query.get('offset', 0)), 0), SEARCH_MAX_OFFSET)
+    except ValueError:
+        return None, 'Limit and offset must be integers'
+    
+    escaped = q.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    fuzzy = len(q) >= 3
+    return {
+        'q': q,
+        'pattern': f'%{escaped}%' if fuzzy else f'{escaped}%',
+        'fuzzy': fuzzy,
+        'limit': limit + 1,
+        'offset': offset
+    }, None
+
+def search_entities(cur, params: dict, kind: str) -> dict:
+    '''Ищет игроков и/или команды по триграммному сходству со словами, страница из limit записей'''
+    result = {}
+    for name, sql in (('players', SEARCH_PLAYERS_SQL), ('teams', SEARCH_TEAMS_SQL)):
+        if kind not in ('all', name):
+            continue
+        cur.execute(sql, params)
+        rows = cur.fetchall()
+        result[name] = [dict(r) for r in rows[:params['limit'] - 1]]
+        result[f'{name}_has_more'] = len(rows) >= params['limit']
+    return result
 
 def handler(event: dict, context) -> dict:
     '''API для административных функций: управление игроками, командами, матчами'''
@@ -31,6 +440,9 @@ def handler(event: dict, context) -> dict:
     
     conn = None
     try:
+        import psycopg2
+        from psycopg2.extras import RealDictCursor
+        
         conn = psycopg2.connect(os.environ['DATABASE_URL'])
         cur = conn.cursor(cursor_factory=RealDictCursor)
         
@@ -170,7 +582,7 @@ def handler(event: dict, context) -> dict:
                 return {
                     'statusCode': 200,
                     'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-                    'body': json.dumps({'match': dict(match)}),
+                    'body': json.dumps({'match': dict(match)}, default=str),
                     'isBase64Encoded': False
                 }
             
@@ -197,6 +609,21 @@ def handler(event: dict, context) -> dict:
                 )
                 match = cur.fetchone()
                 
+                cur.execute("UPDATE matches SET stats_applied = TRUE WHERE id = %s AND stats_applied IS NOT TRUE RETURNING id", (match_id,))
+                first_completion = cur.fetchone() is not None
+                stats_team_ids = [t for t in (match['team1_id'], match['team2_id']) if t] if match else []
+                
+                if stats_team_ids:
+                    cur.execute(
+                        "SELECT 1 FROM team_stats WHERE team_id = ANY(%s) AND last_match_at >= %s LIMIT 1",
+                        (stats_team_ids, match['match_date'])
+                    )
+                    out_of_order = cur.fetchone() is not None
+                    if first_completion and not out_of_order:
+                        apply_team_stats(cur, match)
+                    else:
+                        rebuild_team_stats(cur, stats_team_ids)
+                
                 if winner_team_id:
                     cur.execute("UPDATE teams SET matches_played = matches_played + 1, matches_won = matches_won + 1, rating = rating + 50 WHERE id = %s", (winner_team_id,))
                     loser_team_id = match['team1_id'] if match['team1_id'] != winner_team_id else match['team2_id']
@@ -219,11 +646,68 @@ def handler(event: dict, context) -> dict:
                 return {
                     'statusCode': 200,
                     'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-                    'body': json.dumps({'match': dict(match)}),
+                    'body': json.dumps({'match': dict(match)}, default=str),
+                    'isBase64Encoded': False
+                }
+            
+            elif action == 'rebuild_team_stats':
+                rebuilt = rebuild_team_stats(cur)
+                conn.commit()
+                
+                return {
+                    'statusCode': 200,
+                    'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                    'body': json.dumps({'rebuilt': rebuilt}),
+                    'isBase64Encoded': False
+                }
+            
+            elif action in BATCH_ACTIONS:
+                items = body.get('items')
+                
+                if not isinstance(items, list) or not items or len(items) > MAX_BATCH_SIZE:
+                    return {
+                        'statusCode': 400,
+                        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                        'body': json.dumps({'error': f'Items must be a non-empty list of at most {MAX_BATCH_SIZE} entries'}),
+                        'isBase64Encoded': False
+                    }
+                
+                results = BATCH_ACTIONS[action](cur, items, user)
+                conn.commit()
+                
+                return {
+                    'statusCode': 200,
+                    'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                    'body': json.dumps({
+                        'results': results,
+                        'succeeded': sum(1 for r in results if r['ok']),
+                        'failed': sum(1 for r in results if not r['ok'])
+                    }, default=str),
                     'isBase64Encoded': False
                 }
         
         elif method == 'GET':
+            query = event.get('queryStringParameters') or {}
+            
+            if 'q' in query:
+                params, error = search_params(query)
+                kind = query.get('type', 'all')
+                
+                if error or kind not in ('all', 'players', 'teams'):
+                    return {
+                        'statusCode': 400,
+                        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                        'body': json.dumps({'error': error or 'Type must be all, players or teams'}),
+                        'isBase64Encoded': False
+                    }
+                
+                return {
+                    'statusCode': 200,
+                    'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                    'body': json.dumps(search_entities(cur, params, kind), ensure_ascii=False),
+                    'isBase64Encoded': False
+                }
+            
             cur.execute("SELECT id, name, email, rating, matches_played, matches_won, team, is_banned, is_admin FROM users ORDER BY rating DESC")
             players = cur.fetchall()
             
@@ -2,9 +2,100 @@ import json
 import os
 import hashlib
 import secrets
+import math
+import random
+import time
 from datetime import datetime, timedelta
-import psycopg2
-from psycopg2.extras import RealDictCursor
+
+RATE_LIMITS = {
+    'login_ip': (20, 20 / 60),
+    'login_email': (5, 5 / 60),
+}
+RATE_LIMIT_MAX_KEYS = 10000
+
+_buckets = {}
+
+def get_client_ip(event: dict) -> str:
+    '''Определяет IP клиента: sourceIp шлюза, иначе последний адрес X-Forwarded-For, добавленный прокси'''
+    ip = event.get('requestContext', {}).get('identity', {}).get('sourceIp')
+    if not ip:
+        headers = event.get('headers', {})
+        forwarded = headers.get('X-Forwarded-For') or headers.get('x-forwarded-for') or ''
+        ip = forwarded.split(',')[-1].strip()
+    return ip or 'unknown'
+
+def evict_buckets(now: float):
+    '''Освобождает место в _buckets: сначала восполненные до ёмкости bucket'ы, затем самые полные'''
+    fill = {}
+    for key, (tokens, updated_at) in list(_buckets.items()):
+        capacity, rate = RATE_LIMITS[key.split(':', 1)[0]]
+        fill[key] = (tokens + (now - updated_at) * rate) / capacity
+        if fill[key] >= 1:
+            del _buckets[key]
+    excess = len(_buckets) - RATE_LIMIT_MAX_KEYS * 9 // 10
+    if excess > 0:
+        for key in sorted(_buckets, key=fill.get, reverse=True)[:excess]:
+            del _buckets[key]
+
+def take_local_token(key: str, capacity: int, rate: float) -> float:
+    '''Берёт токен из bucket в памяти инстанса, возвращает секунды до следующей попытки (0 — разрешено)'''
+    now = time.monotonic()
+    tokens, updated_at = _buckets.get(key, (capacity, now))
+    tokens = min(capacity, tokens + (now - updated_at) * rate)
+    if key not in _buckets and len(_buckets) >= RATE_LIMIT_MAX_KEYS:
+        evict_buckets(now)
+    if tokens < 1:
+        _buckets[key] = (tokens, now)
+        return (1 - tokens) / rate
+    _buckets[key] = (tokens - 1, now)
+    return 0
+
+def take_shared_token(cur, key: str, capacity: int, rate: float) -> float:
+    '''Берёт токен из общего bucket в таблице rate_limit_buckets'''
+    refilled = """LEAST(%(capacity)s, rate_limit_buckets.tokens
+        + EXTRACT(EPOCH FROM NOW() - rate_limit_buckets.updated_at) * %(rate)s)"""
+    cur.execute(
+        f"""INSERT INTO rate_limit_buckets (bucket_key, tokens, allowed, updated_at)
+            VALUES (%(key)s, %(capacity)s - 1, TRUE, NOW())
+            ON CONFLICT (bucket_key) DO UPDATE SET
+                tokens = CASE WHEN {refilled} >= 1 THEN {refilled} - 1 ELSE {refilled} END,
+                allowed = {refilled} >= 1,
+                updated_at = NOW()
+            RETURNING tokens, allowed""",
+        {'key': key, 'capacity': capacity, 'rate': rate}
+    )
+    bucket = cur.fetchone()
+    if random.random() < 0.01:
+        cur.execute("DELETE FROM rate_limit_buckets WHERE updated_at < NOW() - INTERVAL '1 hour'")
+    return 0 if bucket['allowed'] else (1 - bucket['tokens']) / rate
+
+def check_rate_limits(checks: list, cur=None) -> float:
+    '''Проверяет лимиты по списку (имя лимита, значение ключа); с cur — в общем хранилище Postgres'''
+    for name, value in checks:
+        capacity, rate = RATE_LIMITS[name]
+        key = f"{name}:{hashlib.sha256(value.encode()).hexdigest()[:40]}"
+        if cur is None:
+            retry_after = take_local_token(key, capacity, rate)
+        else:
+            retry_after = take_shared_token(cur, key, capacity, rate)
+        if retry_after:
+            return retry_after
+    return 0
+
+def shared_rate_limit_enabled() -> bool:
+    return os.environ.get('RATE_LIMIT_STORE') == 'postgres'
+
+def too_many_requests(retry_after: float) -> dict:
+    return {
+        'statusCode': 429,
+        'headers': {
+            'Content-Type': 'application/json',
+            'Access-Control-Allow-Origin': '*',
+            'Retry-After': str(max(1, math.ceil(retry_after)))
+        },
+        'body': json.dumps({'error': 'Too many requests, try again later'}),
+        'isBase64Encoded': False
+    }
 
 def handler(event: dict, context) -> dict:
     '''API для регистрации и авторизации пользователей'''
@@ -24,12 +115,27 @@ def handler(event: dict, context) -> dict:
     
     conn = None
     try:
+        rate_limit_checks = []
+        if method == 'POST':
+            body = json.loads(event.get('body', '{}'))
+            action = body.get('action')
+            
+            if action == 'login':
+                rate_limit_checks.append(('login_ip', get_client_ip(event)))
+                login_email = body.get('email', '').strip().lower()
+                if login_email:
+                    rate_limit_checks.append(('login_email', login_email))
+                retry_after = check_rate_limits(rate_limit_checks)
+                if retry_after:
+                    return too_many_requests(retry_after)
+        
+        import psycopg2
+        from psycopg2.extras import RealDictCursor
+        
         conn = psycopg2.connect(os.environ['DATABASE_URL'])
         cur = conn.cursor(cursor_factory=RealDictCursor)
         
         if method == 'POST':
-            body = json.loads(event.get('body', '{}'))
-            action = body.get('action')
             
             if action == 'register':
                 email = body.get('email', '').strip().lower()
@@ -96,6 +202,12 @@ def handler(event: dict, context) -> dict:
                         'isBase64Encoded': False
                     }
                 
+                if shared_rate_limit_enabled():
+                    retry_after = check_rate_limits(rate_limit_checks, cur)
+                    conn.commit()
+                    if retry_after:
+                        return too_many_requests(retry_after)
+                
                 password_hash = hashlib.sha256(password.encode()).hexdigest()
                 
                 cur.execute(
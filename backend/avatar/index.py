@@ -2,9 +2,6 @@ import json
 import os
 import base64
 import secrets
-import psycopg2
-from psycopg2.extras import RealDictCursor
-import boto3
 
 def handler(event: dict, context) -> dict:
     '''API для загрузки и обновления аватарок пользователей'''
@@ -34,6 +31,9 @@ def handler(event: dict, context) -> dict:
     
     conn = None
     try:
+        import psycopg2
+        from psycopg2.extras import RealDictCursor
+        
         conn = psycopg2.connect(os.environ['DATABASE_URL'])
         cur = conn.cursor(cursor_factory=RealDictCursor)
         
@@ -86,6 +86,8 @@ def handler(event: dict, context) -> dict:
             file_extension = content_type.split('/')[-1]
             filename = f"avatars/{user_id}_{secrets.token_hex(8)}.{file_extension}"
             
+            import boto3
+            
             s3 = boto3.client('s3',
                 endpoint_url='https://bucket.poehali.dev',
                 aws_access_key_id=os.environ['AWS_ACCESS_KEY_ID'],
@@ -1,7 +1,99 @@
 import json
 import os
-import psycopg2
-from psycopg2.extras import RealDictCursor
+import hashlib
+import math
+import random
+import time
+
+RATE_LIMITS = {
+    'join_ip': (30, 1),
+    'join_token': (5, 5 / 60),
+}
+RATE_LIMIT_MAX_KEYS = 10000
+
+_buckets = {}
+
+def get_client_ip(event: dict) -> str:
+    '''Определяет IP клиента: sourceIp шлюза, иначе последний адрес X-Forwarded-For, добавленный прокси'''
+    ip = event.get('requestContext', {}).get('identity', {}).get('sourceIp')
+    if not ip:
+        headers = event.get('headers', {})
+        forwarded = headers.get('X-Forwarded-For') or headers.get('x-forwarded-for') or ''
+        ip = forwarded.split(',')[-1].strip()
+    return ip or 'unknown'
+
+def evict_buckets(now: float):
+    '''Освобождает место в _buckets: сначала восполненные до ёмкости bucket'ы, затем самые полные'''
+    fill = {}
+    for key, (tokens, updated_at) in list(_buckets.items()):
+        capacity, rate = RATE_LIMITS[key.split(':', 1)[0]]
+        fill[key] = (tokens + (now - updated_at) * rate) / capacity
+        if fill[key] >= 1:
+            del _buckets[key]
+    excess = len(_buckets) - RATE_LIMIT_MAX_KEYS * 9 // 10
+    if excess > 0:
+        for key in sorted(_buckets, key=fill.get, reverse=True)[:excess]:
+            del _buckets[key]
+
+def take_local_token(key: str, capacity: int, rate: float) -> float:
+    '''Берёт токен из bucket в памяти инстанса, возвращает секунды до следующей попытки (0 — разрешено)'''
+    now = time.monotonic()
+    tokens, updated_at = _buckets.get(key, (capacity, now))
+    tokens = min(capacity, tokens + (now - updated_at) * rate)
+    if key not in _buckets and len(_buckets) >= RATE_LIMIT_MAX_KEYS:
+        evict_buckets(now)
+    if tokens < 1:
+        _buckets[key] = (tokens, now)
+        return (1 - tokens) / rate
+    _buckets[key] = (tokens - 1, now)
+    return 0
+
+def take_shared_token(cur, key: str, capacity: int, rate: float) -> float:
+    '''Берёт токен из общего bucket в таблице rate_limit_buckets'''
+    refilled = """LEAST(%(capacity)s, rate_limit_buckets.tokens
+        + EXTRACT(EPOCH FROM NOW() - rate_limit_buckets.updated_at) * %(rate)s)"""
+    cur.execute(
+        f"""INSERT INTO rate_limit_buckets (bucket_key, tokens, allowed, updated_at)
+            VALUES (%(key)s, %(capacity)s - 1, TRUE, NOW())
+            ON CONFLICT (bucket_key) DO UPDATE SET
+                tokens = CASE WHEN {refilled} >= 1 THEN {refilled} - 1 ELSE {refilled} END,
+                allowed = {refilled} >= 1,
+                updated_at = NOW()
+            RETURNING tokens, allowed""",
+        {'key': key, 'capacity': capacity, 'rate': rate}
+    )
+    bucket = cur.fetchone()
+    if random.random() < 0.01:
+        cur.execute("DELETE FROM rate_limit_buckets WHERE updated_at < NOW() - INTERVAL '1 hour'")
+    return 0 if bucket['allowed'] else (1 - bucket['tokens']) / rate
+
+def check_rate_limits(checks: list, cur=None) -> float:
+    '''Проверяет лимиты по списку (имя лимита, значение ключа); с cur — в общем хранилище Postgres'''
+    for name, value in checks:
+        capacity, rate = RATE_LIMITS[name]
+        key = f"{name}:{hashlib.sha256(value.encode()).hexdigest()[:40]}"
+        if cur is None:
+            retry_after = take_local_token(key, capacity, rate)
+        else:
+            retry_after = take_shared_token(cur, key, capacity, rate)
+        if retry_after:
+            return retry_after
+    return 0
+
+def shared_rate_limit_enabled() -> bool:
+    return os.environ.get('RATE_LIMIT_STORE') == 'postgres'
+
+def too_many_requests(retry_after: float) -> dict:
+    return {
+        'statusCode': 429,
+        'headers': {
+            'Content-Type': 'application/json',
+            'Access-Control-Allow-Origin': '*',
+            'Retry-After': str(max(1, math.ceil(retry_after)))
+        },
+        'body': json.dumps({'error': 'Too many requests, try again later'}),
+        'isBase64Encoded': False
+    }
 
 def handler(event: dict, context) -> dict:
     '''API для управления матчами: просмотр, регистрация на матч'''
@@ -21,10 +113,87 @@ def handler(event: dict, context) -> dict:
     
     conn = None
     try:
+        session_token = event.get('headers', {}).get('X-Session-Token') or event.get('headers', {}).get('x-session-token')
+        rate_limit_checks = []
+        if method == 'POST':
+            body = json.loads(event.get('body', '{}'))
+            action = body.get('action')
+            
+            if action == 'join_match':
+                rate_limit_checks.append(('join_ip', get_client_ip(event)))
+                if session_token:
+                    rate_limit_checks.append(('join_token', session_token))
+                retry_after = check_rate_limits(rate_limit_checks)
+                if retry_after:
+                    return too_many_requests(retry_after)
+        
+        import psycopg2
+        from psycopg2.extras import RealDictCursor
+        
         conn = psycopg2.connect(os.environ['DATABASE_URL'])
         cur = conn.cursor(cursor_factory=RealDictCursor)
         
         if method == 'GET':
+            team_id = (event.get('queryStringParameters') or {}).get('team_id')
+            
+            if team_id:
+                try:
+                    team_id = int(team_id)
+                except ValueError:
+                    team_id = 0
+                
+                if not 0 < team_id <= 2147483647:
+                    return {
+                        'statusCode': 400,
+                        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                        'body': json.dumps({'error': 'Team ID must be a positive integer'}),
+                        'isBase64Encoded': False
+                    }
+                
+                cur.execute(
+                    """SELECT t.id, t.name, t.description, t.rating,
+                              ts.matches_played, ts.wins, ts.losses, ts.draws, ts.kills, ts.deaths,
+                              ts.current_streak, ts.best_win_streak, ts.last_match_at
+                       FROM teams t LEFT JOIN team_stats ts ON ts.team_id = t.id
+                       WHERE t.id = %s""",
+                    (team_id,)
+                )
+                team = cur.fetchone()
+                
+                if not team:
+                    return {
+                        'statusCode': 404,
+                        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                        'body': json.dumps({'error': 'Team not found'}),
+                        'isBase64Encoded': False
+                    }
+                
+                cur.execute(
+                    """SELECT match_type, matches_played, wins, losses, draws, kills, deaths
+                       FROM team_match_type_stats WHERE team_id = %s ORDER BY matches_played DESC""",
+                    (team_id,)
+                )
+                by_match_type = cur.fetchall()
+                
+                cur.execute(
+                    """SELECT h.opponent_id, t.name as opponent_name, h.matches_played, h.wins, h.losses, h.draws, h.last_match_at
+                       FROM team_head_to_head h JOIN teams t ON t.id = h.opponent_id
+                       WHERE h.team_id = %s ORDER BY h.matches_played DESC""",
+                    (team_id,)
+                )
+                head_to_head = cur.fetchall()
+                
+                return {
+                    'statusCode': 200,
+                    'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                    'body': json.dumps({
+                        'team': dict(team),
+                        'by_match_type': [dict(r) for r in by_match_type],
+                        'head_to_head': [dict(r) for r in head_to_head]
+                    }, default=str),
+                    'isBase64Encoded': False
+                }
+            
             cur.execute("""
                 SELECT m.*, 
                        t1.name as team1_name, 
@@ -49,8 +218,6 @@ def handler(event: dict, context) -> dict:
             }
         
         elif method == 'POST':
-            session_token = event.get('headers', {}).get('X-Session-Token') or event.get('headers', {}).get('x-session-token')
-            
             if not session_token:
                 return {
                     'statusCode': 401,
@@ -59,6 +226,13 @@ def handler(event: dict, context) -> dict:
                     'isBase64Encoded': False
                 }
             
+            shared_checks = rate_limit_checks if shared_rate_limit_enabled() else []
+            if shared_checks:
+                retry_after = check_rate_limits([c for c in shared_checks if c[0] == 'join_ip'], cur)
+                conn.commit()
+                if retry_after:
+                    return too_many_requests(retry_after)
+            
             cur.execute(
                 """SELECT u.id, u.is_banned, tm.team_id FROM users u 
                    LEFT JOIN team_members tm ON u.id = tm.user_id
@@ -76,6 +250,12 @@ def handler(event: dict, context) -> dict:
                     'isBase64Encoded': False
                 }
             
+            if shared_checks:
+                retry_after = check_rate_limits([c for c in shared_checks if c[0] == 'join_token'], cur)
+                conn.commit()
+                if retry_after:
+                    return too_many_requests(retry_after)
+            
             if user['is_banned']:
                 return {
                     'statusCode': 403,
@@ -84,9 +264,6 @@ def handler(event: dict, context) -> dict:
                     'isBase64Encoded': False
                 }
             
-            body = json.loads(event.get('body', '{}'))
-            action = body.get('action')
-            
             if action == 'join_match':
                 match_id = body.get('match_id')
                 
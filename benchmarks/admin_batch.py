@@ -0,0 +1,113 @@
+'''Сравнение пропускной способности пакетных и одиночных операций admin-функции.
+
+Запуск: DATABASE_URL=postgresql://... python benchmarks/admin_batch.py [--items 200]
+
+Создаёт временного администратора, игроков и команду, вызывает handler напрямую
+(без HTTP) по одному элементу и пакетом, печатает операции в секунду и удаляет
+созданные данные.
+'''
+import argparse
+import importlib.util
+import json
+import os
+import secrets
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import psycopg2
+
+BACKEND = Path(__file__).resolve().parent.parent / 'backend'
+
+
+def load_handler(function: str):
+    spec = importlib.util.spec_from_file_location(f'{function}_index', BACKEND / function / 'index.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.handler
+
+
+def call(handler, token: str, body: dict) -> dict:
+    response = handler({
+        'httpMethod': 'POST',
+        'headers': {'X-Session-Token': token},
+        'body': json.dumps(body)
+    }, None)
+    if response['statusCode'] != 200:
+        raise RuntimeError(f"{body['action']} failed: {response['body']}")
+    return json.loads(response['body'])
+
+
+def measure(label: str, count: int, run) -> float:
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+    print(f'{label:<32} {count:>5} items  {elapsed:8.3f}s  {count / elapsed:10.1f} items/s')
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--items', type=int, default=200, help='не больше MAX_BATCH_SIZE (500)')
+    args = parser.parse_args()
+    count = args.items
+
+    conn = psycopg2.connect(os.environ['DATABASE_URL'])
+    cur = conn.cursor()
+    run_id = secrets.token_hex(4)
+    token = secrets.token_urlsafe(32)
+
+    cur.execute(
+        "INSERT INTO users (email, password_hash, name, is_admin) VALUES (%s, '-', 'bench admin', TRUE) RETURNING id",
+        (f'bench-admin-{run_id}@example.com',)
+    )
+    admin_id = cur.fetchone()[0]
+    cur.execute(
+        'INSERT INTO user_sessions (user_id, session_token, expires_at) VALUES (%s, %s, %s)',
+        (admin_id, token, datetime.now() + timedelta(hours=1))
+    )
+    cur.execute(
+        """INSERT INTO users (email, password_hash, name)
+           SELECT 'bench-' || %s || '-' || n || '@example.com', '-', 'bench player ' || n
+           FROM generate_series(1, %s) AS n RETURNING id""",
+        (run_id, count)
+    )
+    player_ids = [row[0] for row in cur.fetchall()]
+    cur.execute('INSERT INTO teams (name) VALUES (%s) RETURNING id', (f'bench-{run_id}',))
+    team_id = cur.fetchone()[0]
+    conn.commit()
+
+    handler = load_handler('admin')
+    match_date = (datetime.now() + timedelta(days=7)).isoformat(timespec='minutes')
+    match_items = [{'title': f'bench {run_id} #{n}', 'match_date': match_date} for n in range(count)]
+
+    try:
+        print(f'admin handler, {count} items per run\n')
+        for label, single, batch in (
+            ('ban_player',
+             lambda: [call(handler, token, {'action': 'ban_player', 'player_id': pid}) for pid in player_ids],
+             lambda: call(handler, token, {'action': 'batch_ban_players',
+                                           'items': [{'player_id': pid, 'banned': False} for pid in player_ids]})),
+            ('add_player_to_team',
+             lambda: [call(handler, token, {'action': 'add_player_to_team', 'team_id': team_id, 'player_id': pid}) for pid in player_ids],
+             lambda: call(handler, token, {'action': 'batch_add_players_to_team',
+                                           'items': [{'team_id': team_id, 'player_id': pid, 'role': 'member'} for pid in player_ids]})),
+            ('create_match',
+             lambda: [call(handler, token, dict(item, action='create_match')) for item in match_items],
+             lambda: call(handler, token, {'action': 'batch_create_matches', 'items': match_items})),
+        ):
+            single_time = measure(f'{label} (single)', count, single)
+            batch_time = measure(f'{label} (batch)', count, batch)
+            print(f'{"speedup":<32} {single_time / batch_time:>22.1f}x\n')
+    finally:
+        cur.execute('DELETE FROM matches WHERE created_by = %s', (admin_id,))
+        cur.execute('DELETE FROM team_members WHERE team_id = %s', (team_id,))
+        cur.execute('DELETE FROM teams WHERE id = %s', (team_id,))
+        cur.execute('DELETE FROM user_sessions WHERE user_id = %s', (admin_id,))
+        cur.execute('DELETE FROM users WHERE id = ANY(%s)', (player_ids + [admin_id],))
+        conn.commit()
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
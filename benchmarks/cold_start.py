@@ -0,0 +1,153 @@
+'''Профилирование холодного старта облачных функций из backend/.
+
+Запуск: python benchmarks/cold_start.py [--runs 5] [--top 8] [auth matches ...]
+
+Для каждой функции:
+  * отчёт `python -X importtime` по импорту index.py — самые тяжёлые модули верхнего уровня;
+  * замер в свежем интерпретаторе: импорт index.py и вызов handler на лёгких путях
+    (OPTIONS, запрос без сессии), которым база и S3 не нужны;
+  * отдельным процессом — время ленивых импортов, которые добавляет путь с базой
+    (psycopg2 и psycopg2.extras, для avatar ещё boto3); только для отчёта, это время
+    сторонних пакетов.
+
+Чтобы проверка не зависела от машины, время процесса с лёгким путём сравнивается
+с базовой линией `python -c "import json"`, замеренной в том же прогоне; по каждому
+замеру берётся минимум из --runs запусков. Допустимое отношение (max_startup_ratio)
+и список тяжёлых модулей лежат в cold_start_budget.json. Скрипт завершается с кодом 1,
+если на лёгких путях загрузились тяжёлые зависимости (psycopg2, boto3) или если
+отношение к базовой линии превышает бюджет.
+'''
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BACKEND = ROOT / 'backend'
+BUDGET_FILE = Path(__file__).resolve().parent / 'cold_start_budget.json'
+
+LIGHT_EVENTS = {
+    'auth': [{'httpMethod': 'OPTIONS'}],
+    'matches': [{'httpMethod': 'OPTIONS'}],
+    'admin': [{'httpMethod': 'OPTIONS'}, {'httpMethod': 'GET', 'headers': {}}],
+    'avatar': [{'httpMethod': 'OPTIONS'}, {'httpMethod': 'POST', 'headers': {}, 'body': '{}'}],
+}
+
+DB_PATH_IMPORTS = {
+    'avatar': ['psycopg2', 'psycopg2.extras', 'boto3'],
+}
+
+BASELINE = [sys.executable, '-c', 'import json']
+
+CHILD = '''
+import importlib, json, sys, time
+started = time.perf_counter()
+import index
+imported = time.perf_counter()
+statuses = [index.handler(event, None)['statusCode'] for event in json.loads(sys.argv[1])]
+finished = time.perf_counter()
+heavy_modules = sorted(name for name in json.loads(sys.argv[2]) if name in sys.modules)
+for name in json.loads(sys.argv[3]):
+    importlib.import_module(name)
+db_imported = time.perf_counter()
+print(json.dumps({
+    'light_ms': (finished - started) * 1000,
+    'db_path_ms': (db_imported - finished) * 1000,
+    'statuses': statuses,
+    'heavy_modules': heavy_modules,
+}))
+'''
+
+
+def import_profile(function: str, top: int) -> list:
+    '''Итог импорта index и самые тяжёлые его прямые импорты по -X importtime: [(модуль, cumulative ms)]'''
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import index'],
+        cwd=BACKEND / function, capture_output=True, text=True
+    )
+    children = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entry = (name.strip(), int(cumulative) / 1000)
+        if depth == 1:
+            children.append(entry)
+        elif depth == 0:
+            if entry[0] == 'index':
+                return [entry] + sorted(children, key=lambda m: m[1], reverse=True)[:top]
+            children = []
+    return []
+
+
+def run_process(args: list, cwd: Path):
+    '''Запускает свежий интерпретатор; возвращает (результат, время процесса в ms)'''
+    started = time.perf_counter()
+    result = subprocess.run(args, cwd=cwd, capture_output=True, text=True)
+    process_ms = (time.perf_counter() - started) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f'{" ".join(args[:3])}: {result.stderr.strip()}')
+    return result, process_ms
+
+
+def cold_start(function: str, heavy_modules: list, db_imports: list) -> dict:
+    events = LIGHT_EVENTS.get(function, [{'httpMethod': 'OPTIONS'}])
+    result, process_ms = run_process(
+        [sys.executable, '-c', CHILD, json.dumps(events), json.dumps(heavy_modules), json.dumps(db_imports)],
+        BACKEND / function
+    )
+    return dict(json.loads(result.stdout), process_ms=process_ms)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('functions', nargs='*')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=8)
+    args = parser.parse_args()
+
+    config = json.loads(BUDGET_FILE.read_text())
+    max_ratio = config['max_startup_ratio']
+    functions = args.functions or sorted(p.parent.name for p in BACKEND.glob('*/index.py'))
+    failures = []
+
+    for function in functions:
+        print(f'== {function}')
+        for name, cumulative in import_profile(function, args.top):
+            print(f'   {cumulative:8.2f} ms  {name}')
+
+        db_imports = DB_PATH_IMPORTS.get(function, ['psycopg2', 'psycopg2.extras'])
+        baseline, light, db_path = [], [], []
+        for _ in range(args.runs):
+            baseline.append(run_process(BASELINE, ROOT)[1])
+            light.append(cold_start(function, config['heavy_modules'], []))
+            db_path.append(cold_start(function, [], db_imports))
+
+        baseline_ms = min(baseline)
+        process_ms = min(r['process_ms'] for r in light)
+        ratio = process_ms / baseline_ms
+        heavy = sorted(set(m for r in light for m in r['heavy_modules']))
+
+        print(f'   {"baseline process:":<28} {baseline_ms:8.2f} ms (python -c "import json")')
+        print(f'   {"light path process:":<28} {process_ms:8.2f} ms = {ratio:.2f}x baseline '
+              f'(budget {max_ratio}x), statuses: {light[0]["statuses"]}')
+        print(f'   {"import + light invoke:":<28} {min(r["light_ms"] for r in light):8.2f} ms')
+        print(f'   {"db path imports:":<28} {min(r["db_path_ms"] for r in db_path):8.2f} ms (report only)')
+        if heavy:
+            failures.append(f'{function}: light paths loaded {", ".join(heavy)}')
+        if ratio > max_ratio:
+            failures.append(f'{function}: light path process {ratio:.2f}x baseline > {max_ratio}x')
+        print()
+
+    if failures:
+        print('Cold start regressions:')
+        for failure in failures:
+            print(f'  {failure}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
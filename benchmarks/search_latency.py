@@ -0,0 +1,147 @@
+'''Замер задержки поиска игроков и команд на синтетических данных.
+
+Запуск: DATABASE_URL=postgresql://... python benchmarks/search_latency.py [--users 100000] [--budget-ms 50]
+
+Создаёт временную схему bench_search с таблицами users и teams, заполняет их
+кириллическими именами, применяет миграцию с триграммными индексами и выполняет
+запросы admin-функции (SEARCH_PLAYERS_SQL, SEARCH_TEAMS_SQL). Печатает p50/p95/p99
+по каждому запросу и завершается с кодом 1, если p95 превышает бюджет.
+'''
+import argparse
+import importlib.util
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import psycopg2
+from psycopg2.extras import RealDictCursor
+
+ROOT = Path(__file__).resolve().parent.parent
+SCHEMA = 'bench_search'
+
+FIRST_NAMES = ['Александр', 'Дмитрий', 'Сергей', 'Михаил', 'Игорь', 'Андрей', 'Алёна', 'Ян', 'Фёдор',
+               'Екатерина', 'Ольга', 'Николай', 'Павел', 'Юлия', 'Артём', 'Ксения', 'Max', 'John']
+LAST_NAMES = ['Иванов', 'Петров', 'Смирнов', 'Козлов', 'Морозов', 'Соколов', 'Попов', 'Лебедев',
+              'Новиков', 'Фёдоров', 'Волков', 'Зайцев', 'Павлов', 'Семёнов', 'Smith', 'Miller']
+NICKNAMES = ['Снайпер', 'Шторм', 'Призрак', 'Танк', 'Ястреб', 'Волк', 'Медведь', 'Ghost', 'Viper', 'Лис']
+TEAM_NAMES = ['Альфа', 'Браво', 'Чарли', 'Дельта', 'Эхо', 'Гроза', 'Ёж', 'Red Wolves', 'Night Owls']
+
+QUERIES = [
+    ('players', 'иван'),
+    ('players', 'Алёна'),
+    ('players', 'алена смирнова'),
+    ('players', 'снайпер'),
+    ('players', 'ивнов'),
+    ('players', 'ян'),
+    ('players', 'player4242'),
+    ('teams', 'альфа'),
+    ('teams', 'ёж'),
+    ('all', 'волк'),
+]
+
+
+def load_function(function: str):
+    spec = importlib.util.spec_from_file_location(f'{function}_index', ROOT / 'backend' / function / 'index.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def populate(cur, users: int):
+    cur.execute(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE')
+    cur.execute(f'CREATE SCHEMA {SCHEMA}')
+    cur.execute(f'SET search_path = {SCHEMA}, public')
+    cur.execute(
+        """CREATE TABLE users (
+               id SERIAL PRIMARY KEY, name VARCHAR(255) NOT NULL, nickname VARCHAR(100),
+               email VARCHAR(255) UNIQUE NOT NULL, team VARCHAR(100), rating INTEGER DEFAULT 1000,
+               matches_played INTEGER DEFAULT 0, matches_won INTEGER DEFAULT 0,
+               is_banned BOOLEAN DEFAULT FALSE, is_admin BOOLEAN DEFAULT FALSE)"""
+    )
+    cur.execute(
+        """CREATE TABLE teams (
+               id SERIAL PRIMARY KEY, name VARCHAR(100) UNIQUE NOT NULL, description TEXT,
+               rating INTEGER DEFAULT 1000, matches_played INTEGER DEFAULT 0, matches_won INTEGER DEFAULT 0)"""
+    )
+    cur.execute(
+        """INSERT INTO users (name, nickname, email, rating)
+           SELECT f[1 + (n * 7) %% array_length(f, 1)] || ' ' || l[1 + (n * 13) %% array_length(l, 1)],
+                  CASE WHEN n %% 3 = 0 THEN NULL ELSE k[1 + (n * 11) %% array_length(k, 1)] || (n %% 1000) END,
+                  'player' || n || '@example.com',
+                  1000 + (n * 37) %% 2000
+           FROM generate_series(1, %s) AS n,
+                (SELECT %s::text[] AS f, %s::text[] AS l, %s::text[] AS k) AS words""",
+        (users, FIRST_NAMES, LAST_NAMES, NICKNAMES)
+    )
+    cur.execute(
+        """INSERT INTO teams (name, rating)
+           SELECT t[1 + n %% array_length(t, 1)] || ' ' || n, 1000 + (n * 17) %% 500
+           FROM generate_series(1, %s) AS n, (SELECT %s::text[] AS t) AS words""",
+        (max(users // 50, 10), TEAM_NAMES)
+    )
+    cur.execute((ROOT / 'db_migrations' / 'V0005__add_trigram_search_indexes.sql').read_text())
+    cur.execute('ANALYZE users')
+    cur.execute('ANALYZE teams')
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--users', type=int, default=100000)
+    parser.add_argument('--runs', type=int, default=50)
+    parser.add_argument('--budget-ms', type=float, default=50.0, help='допустимый p95 для каждого запроса')
+    args = parser.parse_args()
+
+    admin = load_function('admin')
+    conn = psycopg2.connect(os.environ['DATABASE_URL'])
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+    cur.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    try:
+        started = time.perf_counter()
+        populate(cur, args.users)
+        conn.commit()
+        print(f'{args.users} users loaded and indexed in {time.perf_counter() - started:.1f}s\n')
+
+        print(f'{"type":<8} {"query":<18} {"hits":>5} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8}  index')
+        over_budget = []
+        for kind, q in QUERIES:
+            params, error = admin.search_params({'q': q})
+            if error:
+                raise ValueError(error)
+
+            sql = admin.SEARCH_TEAMS_SQL if kind == 'teams' else admin.SEARCH_PLAYERS_SQL
+            cur.execute('EXPLAIN ' + sql, params)
+            uses_index = any('Bitmap Index Scan' in row['QUERY PLAN'] for row in cur.fetchall())
+
+            timings = []
+            for _ in range(args.runs):
+                started = time.perf_counter()
+                result = admin.search_entities(cur, params, kind)
+                timings.append((time.perf_counter() - started) * 1000)
+
+            hits = len(result.get('players', [])) + len(result.get('teams', []))
+            p95 = percentile(timings, 95)
+            print(f'{kind:<8} {q:<18} {hits:>5} {statistics.median(timings):8.2f} {p95:8.2f} '
+                  f'{percentile(timings, 99):8.2f}  {"yes" if uses_index else "NO"}')
+            if p95 > args.budget_ms:
+                over_budget.append(q)
+    finally:
+        conn.rollback()
+        cur.execute(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE')
+        conn.commit()
+        conn.close()
+
+    if over_budget:
+        print(f'\np95 over {args.budget_ms} ms budget: {", ".join(over_budget)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+ALTER TABLE matches ADD COLUMN IF NOT EXISTS stats_applied BOOLEAN DEFAULT FALSE;
+
+CREATE TABLE IF NOT EXISTS team_stats (
+    team_id INTEGER PRIMARY KEY REFERENCES teams(id),
+    matches_played INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    draws INTEGER NOT NULL DEFAULT 0,
+    kills INTEGER NOT NULL DEFAULT 0,
+    deaths INTEGER NOT NULL DEFAULT 0,
+    current_streak INTEGER NOT NULL DEFAULT 0,
+    best_win_streak INTEGER NOT NULL DEFAULT 0,
+    last_match_at TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS team_match_type_stats (
+    team_id INTEGER NOT NULL REFERENCES teams(id),
+    match_type VARCHAR(50) NOT NULL,
+    matches_played INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    draws INTEGER NOT NULL DEFAULT 0,
+    kills INTEGER NOT NULL DEFAULT 0,
+    deaths INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (team_id, match_type)
+);
+
+CREATE TABLE IF NOT EXISTS team_head_to_head (
+    team_id INTEGER NOT NULL REFERENCES teams(id),
+    opponent_id INTEGER NOT NULL REFERENCES teams(id),
+    matches_played INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    draws INTEGER NOT NULL DEFAULT 0,
+    last_match_at TIMESTAMP,
+    PRIMARY KEY (team_id, opponent_id)
+);
@@ -0,0 +1,6 @@
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_users_name_trgm ON users USING GIN (lower(translate(name, 'Ёё', 'Ее')) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_users_nickname_trgm ON users USING GIN (lower(translate(nickname, 'Ёё', 'Ее')) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_users_email_trgm ON users USING GIN (email gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_teams_name_trgm ON teams USING GIN (lower(translate(name, 'Ёё', 'Ее')) gin_trgm_ops);
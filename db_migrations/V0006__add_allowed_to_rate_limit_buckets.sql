@@ -0,0 +1 @@
+ALTER TABLE rate_limit_buckets ADD COLUMN IF NOT EXISTS allowed BOOLEAN NOT NULL DEFAULT TRUE;
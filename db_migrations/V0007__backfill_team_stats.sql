@@ -0,0 +1,58 @@
+CREATE TEMPORARY TABLE backfill_team_results AS
+SELECT m.id AS match_id, m.match_type, m.match_date, t.team_id, t.opponent_id,
+       CASE WHEN m.winner_team_id = t.team_id THEN 1 ELSE 0 END AS wins,
+       CASE WHEN m.winner_team_id IS NOT NULL AND m.winner_team_id <> t.team_id THEN 1 ELSE 0 END AS losses,
+       CASE WHEN m.winner_team_id IS NULL THEN 1 ELSE 0 END AS draws,
+       COALESCE(p.kills, 0) AS kills,
+       COALESCE(p.deaths, 0) AS deaths
+FROM matches m
+CROSS JOIN LATERAL (VALUES (m.team1_id, m.team2_id), (m.team2_id, m.team1_id)) AS t(team_id, opponent_id)
+LEFT JOIN (
+    SELECT match_id, team_id, SUM(kills) AS kills, SUM(deaths) AS deaths
+    FROM match_participants
+    WHERE team_id IS NOT NULL AND status <> 'cancelled'
+    GROUP BY match_id, team_id
+) p ON p.match_id = m.id AND p.team_id = t.team_id
+WHERE m.status = 'completed' AND t.team_id IS NOT NULL AND t.team_id IS DISTINCT FROM t.opponent_id;
+
+TRUNCATE team_stats, team_match_type_stats, team_head_to_head;
+
+WITH ordered AS (
+    SELECT team_id, wins, losses,
+           ROW_NUMBER() OVER (PARTITION BY team_id ORDER BY match_date, match_id) AS position,
+           ROW_NUMBER() OVER (PARTITION BY team_id, wins, losses ORDER BY match_date, match_id) AS outcome_position
+    FROM backfill_team_results
+), runs AS (
+    SELECT team_id, wins, losses, COUNT(*) AS length, MAX(position) AS last_position
+    FROM ordered
+    GROUP BY team_id, wins, losses, position - outcome_position
+), streaks AS (
+    SELECT team_id,
+           MAX(CASE WHEN wins = 1 THEN length ELSE 0 END) AS best_win_streak,
+           (ARRAY_AGG(CASE WHEN wins = 1 THEN length WHEN losses = 1 THEN -length ELSE 0 END
+                      ORDER BY last_position DESC))[1] AS current_streak
+    FROM runs
+    GROUP BY team_id
+)
+INSERT INTO team_stats (team_id, matches_played, wins, losses, draws, kills, deaths,
+                        current_streak, best_win_streak, last_match_at)
+SELECT r.team_id, COUNT(*), SUM(r.wins), SUM(r.losses), SUM(r.draws), SUM(r.kills), SUM(r.deaths),
+       s.current_streak, s.best_win_streak, MAX(r.match_date)
+FROM backfill_team_results r
+JOIN streaks s ON s.team_id = r.team_id
+GROUP BY r.team_id, s.current_streak, s.best_win_streak;
+
+INSERT INTO team_match_type_stats (team_id, match_type, matches_played, wins, losses, draws, kills, deaths)
+SELECT team_id, match_type, COUNT(*), SUM(wins), SUM(losses), SUM(draws), SUM(kills), SUM(deaths)
+FROM backfill_team_results
+GROUP BY team_id, match_type;
+
+INSERT INTO team_head_to_head (team_id, opponent_id, matches_played, wins, losses, draws, last_match_at)
+SELECT team_id, opponent_id, COUNT(*), SUM(wins), SUM(losses), SUM(draws), MAX(match_date)
+FROM backfill_team_results
+WHERE opponent_id IS NOT NULL
+GROUP BY team_id, opponent_id;
+
+UPDATE matches SET stats_applied = (status = 'completed');
+
+DROP TABLE backfill_team_results;
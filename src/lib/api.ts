@@ -43,6 +43,65 @@ export interface Match {
   registered_players: number;
 }
 
+export interface TeamRecord {
+  matches_played: number;
+  wins: number;
+  losses: number;
+  draws: number;
+}
+
+export interface TeamStats {
+  team: Team & Partial<TeamRecord> & {
+    kills?: number;
+    deaths?: number;
+    current_streak?: number;
+    best_win_streak?: number;
+    last_match_at?: string;
+  };
+  by_match_type: (TeamRecord & { match_type: string; kills: number; deaths: number })[];
+  head_to_head: (TeamRecord & { opponent_id: number; opponent_name: string; last_match_at?: string })[];
+}
+
+export interface BatchResult<T> {
+  index: number;
+  ok: boolean;
+  error?: string;
+  player?: T;
+  member?: T;
+  match?: T;
+}
+
+export interface BatchResponse<T> {
+  results: BatchResult<T>[];
+  succeeded: number;
+  failed: number;
+}
+
+const runBatch = async <T>(action: string, items: object[]): Promise<BatchResponse<T>> => {
+  const response = await fetch(ADMIN_API, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      'X-Session-Token': getToken() || '',
+    },
+    body: JSON.stringify({ action, items }),
+  });
+  
+  if (!response.ok) {
+    const error = await response.json();
+    throw new Error(error.error || `Failed to run ${action}`);
+  }
+  
+  return response.json();
+};
+
+export interface SearchResponse {
+  players?: (Player & { nickname?: string; score: number })[];
+  teams?: (Team & { score: number })[];
+  players_has_more?: boolean;
+  teams_has_more?: boolean;
+}
+
 export const adminAPI = {
   async getAdminData(): Promise<{ players: Player[]; teams: Team[] }> {
     const response = await fetch(ADMIN_API, {
@@ -57,6 +116,24 @@ export const adminAPI = {
     return response.json();
   },
 
+  async search(q: string, options: { type?: 'all' | 'players' | 'teams'; limit?: number; offset?: number } = {}): Promise<SearchResponse> {
+    const params = new URLSearchParams({ q });
+    if (options.type) params.set('type', options.type);
+    if (options.limit !== undefined) params.set('limit', String(options.limit));
+    if (options.offset !== undefined) params.set('offset', String(options.offset));
+    
+    const response = await fetch(`${ADMIN_API}?${params}`, {
+      headers: { 'X-Session-Token': getToken() || '' },
+    });
+    
+    if (!response.ok) {
+      const error = await response.json();
+      throw new Error(error.error || 'Failed to search');
+    }
+    
+    return response.json();
+  },
+
   async createTeam(name: string, description?: string): Promise<Team> {
     const response = await fetch(ADMIN_API, {
       method: 'POST',
@@ -158,6 +235,44 @@ export const adminAPI = {
     const result = await response.json();
     return result.match;
   },
+
+  batchBanPlayers(items: { player_id: number; banned?: boolean }[]) {
+    return runBatch<Pick<Player, 'id' | 'email' | 'name' | 'is_banned'>>('batch_ban_players', items);
+  },
+
+  batchAddPlayersToTeam(items: { team_id: number; player_id: number; role?: string }[]) {
+    return runBatch<{ id: number; team_id: number; user_id: number; role: string }>('batch_add_players_to_team', items);
+  },
+
+  batchCreateMatches(items: {
+    title: string;
+    match_type?: string;
+    match_date: string;
+    max_players?: number;
+    team1_id?: number;
+    team2_id?: number;
+  }[]) {
+    return runBatch<Match>('batch_create_matches', items);
+  },
+
+  async rebuildTeamStats(): Promise<{ teams: number; matches: number }> {
+    const response = await fetch(ADMIN_API, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        'X-Session-Token': getToken() || '',
+      },
+      body: JSON.stringify({ action: 'rebuild_team_stats' }),
+    });
+    
+    if (!response.ok) {
+      const error = await response.json();
+      throw new Error(error.error || 'Failed to rebuild team stats');
+    }
+    
+    const result = await response.json();
+    return result.rebuilt;
+  },
 };
 
 export const matchesAPI = {
@@ -173,6 +288,17 @@ export const matchesAPI = {
     return result.matches;
   },
 
+  async getTeamStats(teamId: number): Promise<TeamStats> {
+    const response = await fetch(`${MATCHES_API}?team_id=${teamId}`);
+    
+    if (!response.ok) {
+      const error = await response.json();
+      throw new Error(error.error || 'Failed to fetch team stats');
+    }
+    
+    return response.json();
+  },
+
   async joinMatch(matchId: number): Promise<void> {
     const response = await fetch(MATCHES_API, {
       method: 'POST',
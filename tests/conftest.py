@@ -0,0 +1,17 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+BACKEND = Path(__file__).resolve().parent.parent / 'backend'
+
+
+@pytest.fixture
+def load_function():
+    '''Загружает backend/<function>/index.py как отдельный модуль со своим состоянием'''
+    def load(function: str):
+        spec = importlib.util.spec_from_file_location(f'{function}_index', BACKEND / function / 'index.py')
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    return load
@@ -0,0 +1,131 @@
+import pytest
+
+TEAMS = {1: 'Альфа', 2: 'Браво'}
+
+
+@pytest.fixture
+def admin(load_function):
+    return load_function('admin')
+
+
+def test_valid_match_item_passes(admin):
+    item = {'title': 'Финал', 'match_date': '2026-11-01T10:00', 'match_type': 'Турнир',
+            'max_players': 20, 'team1_id': 1, 'team2_id': 2}
+
+    assert admin.match_item_error(item, TEAMS) is None
+
+
+@pytest.mark.parametrize('override', [
+    {'title': None},
+    {'title': 't' * 256},
+    {'title': 42},
+    {'match_date': 'tomorrow'},
+    {'match_date': 20261101},
+    {'match_type': None},
+    {'match_type': 'x' * 51},
+    {'max_players': '20'},
+    {'max_players': 2 ** 31},
+    {'team1_id': True},
+    {'team1_id': 2 ** 40},
+    {'team2_id': 3},
+])
+def test_invalid_match_item_is_reported(admin, override):
+    item = dict({'title': 'Финал', 'match_date': '2026-11-01T10:00'}, **override)
+
+    assert admin.match_item_error(item, TEAMS)
+
+
+@pytest.mark.parametrize('value', [None, 0, -1, True, '1', 2 ** 31])
+def test_item_id_rejects_values_outside_int4(admin, value):
+    assert admin.item_id({'player_id': value}, 'player_id') is None
+
+
+def test_item_id_accepts_int4_range(admin):
+    assert admin.item_id({'player_id': admin.MAX_INT4}, 'player_id') == admin.MAX_INT4
+
+
+PLAYERS = {10: 'p10@example.com', 11: 'p11@example.com'}
+
+
+class FakeCursor:
+    '''Отвечает на запросы existing_ids и nextval; RETURNING-строки отдаёт в обратном порядке'''
+
+    def __init__(self):
+        self.next_id = 100
+        self.rows = []
+
+    def execute(self, sql, params=None):
+        if 'FROM teams' in sql:
+            self.rows = [{'id': i, 'name': TEAMS[i]} for i in params[0] if i in TEAMS]
+        elif 'FROM users' in sql:
+            self.rows = [{'id': i, 'name': PLAYERS[i]} for i in params[0] if i in PLAYERS]
+        elif 'nextval' in sql:
+            self.rows = [{'id': self.next_id + n} for n in range(params[0])]
+        else:
+            self.rows = []
+
+    def fetchall(self):
+        return self.rows
+
+
+def fake_execute_values(cur, sql, rows, template=None, page_size=100, fetch=False):
+    if 'SET is_banned' in sql:
+        result = [{'id': i, 'email': PLAYERS[i], 'name': 'P', 'is_banned': banned} for i, banned in rows if i in PLAYERS]
+    elif 'INTO team_members' in sql:
+        result = [{'id': n, 'team_id': t, 'user_id': u, 'role': role} for n, (t, u, role) in enumerate(rows)]
+    elif 'INTO matches' in sql:
+        result = [{'id': row[0], 'title': row[1]} for row in rows]
+    else:
+        result = []
+    return list(reversed(result)) if fetch else None
+
+
+@pytest.fixture
+def cur(monkeypatch):
+    extras = pytest.importorskip('psycopg2.extras')
+    monkeypatch.setattr(extras, 'execute_values', fake_execute_values)
+    return FakeCursor()
+
+
+def test_batch_ban_maps_results_to_items(admin, cur):
+    results = admin.batch_ban_players(cur, [
+        {'player_id': 10}, {'player_id': 99}, 'x', {'player_id': 11, 'banned': False}, {'player_id': 10},
+    ], {'id': 1})
+
+    assert [r['ok'] for r in results] == [True, False, False, True, True]
+    assert [r['index'] for r in results] == [0, 1, 2, 3, 4]
+    assert results[0]['player']['id'] == results[4]['player']['id'] == 10
+    assert results[1]['error'] == 'Player not found'
+    assert results[2]['error'] == 'Valid player ID required'
+    assert results[3]['player'] == {'id': 11, 'email': PLAYERS[11], 'name': 'P', 'is_banned': False}
+
+
+def test_batch_add_players_maps_members_by_team_and_player(admin, cur):
+    results = admin.batch_add_players_to_team(cur, [
+        {'team_id': 1, 'player_id': 10},
+        {'team_id': 2, 'player_id': 11, 'role': 'captain'},
+        {'team_id': 1, 'player_id': 99},
+        {'team_id': 3, 'player_id': 10},
+        None,
+        {'team_id': 1, 'player_id': 10, 'role': 'medic'},
+    ], {'id': 1})
+
+    assert [r['ok'] for r in results] == [True, True, False, False, False, True]
+    assert (results[1]['member']['team_id'], results[1]['member']['user_id'], results[1]['member']['role']) == (2, 11, 'captain')
+    assert results[0]['member'] == results[5]['member']
+    assert results[5]['member']['role'] == 'medic'
+    assert results[2]['error'] == 'Player not found'
+    assert results[3]['error'] == 'Team not found'
+    assert results[4]['error'] == 'Valid team ID and player ID required'
+
+
+def test_batch_create_matches_maps_rows_by_preallocated_id(admin, cur):
+    results = admin.batch_create_matches(cur, [
+        {'title': 'Первый', 'match_date': '2026-11-01T10:00'},
+        {'title': 'Без даты'},
+        {'title': 'Второй', 'match_date': '2026-11-02T10:00', 'team1_id': 1},
+    ], {'id': 1})
+
+    assert [r['ok'] for r in results] == [True, False, True]
+    assert results[0]['match'] == {'id': 100, 'title': 'Первый'}
+    assert results[2]['match'] == {'id': 101, 'title': 'Второй'}
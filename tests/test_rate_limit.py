@@ -0,0 +1,99 @@
+import pytest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr('time.monotonic', fake)
+    return fake
+
+
+def retry_after(module, checks: list) -> int:
+    wait = module.check_rate_limits(checks)
+    return int(module.too_many_requests(wait)['headers']['Retry-After']) if wait else 0
+
+
+@pytest.mark.parametrize('function, limit', [('auth', 'login_email'), ('matches', 'join_token')])
+def test_burst_is_limited_to_capacity(clock, load_function, function, limit):
+    module = load_function(function)
+    capacity, _ = module.RATE_LIMITS[limit]
+
+    allowed = [retry_after(module, [(limit, 'user@example.com')]) == 0 for _ in range(capacity + 3)]
+
+    assert allowed == [True] * capacity + [False] * 3
+
+
+@pytest.mark.parametrize('function, limit', [('auth', 'login_email'), ('matches', 'join_token')])
+def test_client_obeying_retry_after_gets_through(clock, load_function, function, limit):
+    module = load_function(function)
+    capacity, _ = module.RATE_LIMITS[limit]
+    checks = [(limit, 'user@example.com')]
+    for _ in range(capacity):
+        assert retry_after(module, checks) == 0
+
+    for _ in range(5):
+        wait = retry_after(module, checks)
+        assert wait > 0
+        clock.now += wait
+        assert retry_after(module, checks) == 0
+
+
+def test_rejected_requests_do_not_extend_the_wait(clock, load_function):
+    module = load_function('auth')
+    checks = [('login_email', 'user@example.com')]
+    while retry_after(module, checks) == 0:
+        pass
+
+    first_wait = retry_after(module, checks)
+    for _ in range(10):
+        clock.now += 1
+        retry_after(module, checks)
+    assert retry_after(module, checks) == first_wait - 10
+
+
+@pytest.mark.parametrize('function', ['auth', 'matches'])
+def test_full_key_store_keeps_exhausted_limits(clock, load_function, function):
+    module = load_function(function)
+    limit = min(module.RATE_LIMITS, key=lambda name: module.RATE_LIMITS[name][1])
+    checks = [(limit, 'victim')]
+    while retry_after(module, checks) == 0:
+        pass
+
+    for n in range(module.RATE_LIMIT_MAX_KEYS * 2):
+        clock.now += 0.0001
+        module.check_rate_limits([(limit, f'spoofed-{n}')])
+
+    assert len(module._buckets) <= module.RATE_LIMIT_MAX_KEYS
+    assert retry_after(module, checks) > 0
+
+
+def test_refilled_buckets_are_evicted_first(clock, load_function):
+    module = load_function('auth')
+    module.check_rate_limits([('login_email', 'idle@example.com')])
+    clock.now += 3600
+    for n in range(module.RATE_LIMIT_MAX_KEYS - 1):
+        module.check_rate_limits([('login_ip', f'ip-{n}')])
+
+    module.check_rate_limits([('login_ip', 'one-more')])
+
+    assert not any(key.startswith('login_email:') for key in module._buckets)
+    assert len(module._buckets) <= module.RATE_LIMIT_MAX_KEYS
+
+
+@pytest.mark.parametrize('event, ip', [
+    ({'requestContext': {'identity': {'sourceIp': '203.0.113.7'}},
+      'headers': {'X-Forwarded-For': '1.2.3.4, 203.0.113.9'}}, '203.0.113.7'),
+    ({'headers': {'X-Forwarded-For': '1.2.3.4, 198.51.100.2'}}, '198.51.100.2'),
+    ({'headers': {'x-forwarded-for': '198.51.100.3'}}, '198.51.100.3'),
+    ({'headers': {}}, 'unknown'),
+])
+def test_client_ip_ignores_client_supplied_forwarded_entries(load_function, event, ip):
+    assert load_function('auth').get_client_ip(event) == ip
@@ -0,0 +1,89 @@
+import pytest
+
+
+@pytest.fixture
+def admin(load_function):
+    return load_function('admin')
+
+
+def test_short_query_is_rejected(admin):
+    params, error = admin.search_params({'q': '  и  '})
+
+    assert params is None
+    assert error
+
+
+def test_query_is_lowercased_folded_and_collapsed(admin):
+    params, _ = admin.search_params({'q': '  Алёна   СЕМЁНОВА '})
+
+    assert params['q'] == 'алена семенова'
+
+
+def test_two_characters_match_by_prefix_only(admin):
+    params, _ = admin.search_params({'q': 'Ян'})
+
+    assert params['pattern'] == 'ян%'
+    assert params['fuzzy'] is False
+
+
+def test_three_characters_match_substring_and_words(admin):
+    params, _ = admin.search_params({'q': 'ивнов'})
+
+    assert params['pattern'] == '%ивнов%'
+    assert params['fuzzy'] is True
+
+
+@pytest.mark.parametrize('q, pattern', [
+    ('100%', '%100\\%%'),
+    ('a_b', '%a\\_b%'),
+    ('c:\\x', '%c:\\\\x%'),
+    ('%_', '\\%\\_%'),
+])
+def test_like_wildcards_are_escaped(admin, q, pattern):
+    params, _ = admin.search_params({'q': q})
+
+    assert params['pattern'] == pattern
+    assert params['q'] == q
+
+
+@pytest.mark.parametrize('query, limit, offset', [
+    ({}, 20, 0),
+    ({'limit': '5', 'offset': '40'}, 5, 40),
+    ({'limit': '0', 'offset': '-3'}, 1, 0),
+    ({'limit': '10000', 'offset': '10000000'}, 50, 1000),
+])
+def test_limit_and_offset_are_capped(admin, query, limit, offset):
+    params, _ = admin.search_params(dict(query, q='волк'))
+
+    assert params['limit'] == limit + 1
+    assert params['offset'] == offset
+
+
+def test_non_integer_limit_is_rejected(admin):
+    params, error = admin.search_params({'q': 'волк', 'limit': 'ten'})
+
+    assert params is None
+    assert error
+
+
+class FakeCursor:
+    def __init__(self, rows: int):
+        self.count = rows
+        self.rows = []
+
+    def execute(self, sql, params):
+        self.rows = [{'id': n} for n in range(min(self.count, params['limit']))]
+
+    def fetchall(self):
+        return self.rows
+
+
+@pytest.mark.parametrize('rows, returned, has_more', [(2, 2, False), (3, 3, False), (4, 3, True)])
+def test_has_more_uses_extra_row(admin, rows, returned, has_more):
+    params, _ = admin.search_params({'q': 'волк', 'limit': '3'})
+
+    result = admin.search_entities(FakeCursor(rows), params, 'teams')
+
+    assert len(result['teams']) == returned
+    assert result['teams_has_more'] is has_more
+    assert 'players' not in result
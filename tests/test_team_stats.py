@@ -0,0 +1,102 @@
+import pytest
+
+DAY = '2026-10-{:02d} 18:00'
+
+
+@pytest.fixture
+def admin(load_function):
+    return load_function('admin')
+
+
+def match(match_id, team1, team2, winner, day, match_type='Турнир'):
+    return {'id': match_id, 'match_type': match_type, 'match_date': DAY.format(day),
+            'team1_id': team1, 'team2_id': team2, 'winner_team_id': winner}
+
+
+class FakeCursor:
+    '''Отдаёт завершённые матчи (с фильтром по командам, как в запросе) и пустые итоги участников'''
+
+    def __init__(self, matches):
+        self.matches = matches
+        self.rows = []
+        self.executed = []
+
+    def execute(self, sql, params=None):
+        self.executed.append(sql)
+        if 'FROM matches m WHERE' in sql and 'ORDER BY' in sql:
+            team_ids = params[0] if params else None
+            self.rows = sorted(
+                (m for m in self.matches if team_ids is None or {m['team1_id'], m['team2_id']} & set(team_ids)),
+                key=lambda m: (m['match_date'], m['id'])
+            )
+        else:
+            self.rows = []
+
+    def fetchall(self):
+        return self.rows
+
+
+@pytest.fixture
+def written(monkeypatch):
+    extras = pytest.importorskip('psycopg2.extras')
+    tables = {}
+
+    def fake_execute_values(cur, sql, rows, template=None, page_size=100, fetch=False):
+        tables[sql.split('INTO', 1)[1].split()[0]] = rows
+
+    monkeypatch.setattr(extras, 'execute_values', fake_execute_values)
+    return tables
+
+
+def team_stats(written) -> dict:
+    '''{team_id: (played, wins, losses, draws, current_streak, best_win_streak)}'''
+    return {row[0]: row[1:5] + row[7:9] for row in written['team_stats']}
+
+
+def test_team_results_win_and_loss(admin):
+    assert admin.team_results(match(1, 1, 2, 2, 1)) == [(1, 2, 0, 1, 0), (2, 1, 1, 0, 0)]
+
+
+def test_team_results_draw(admin):
+    assert admin.team_results(match(1, 1, 2, None, 1)) == [(1, 2, 0, 0, 1), (2, 1, 0, 0, 1)]
+
+
+def test_team_results_team_without_opponent(admin):
+    assert admin.team_results(match(1, None, 2, 2, 1)) == [(2, None, 1, 0, 0)]
+    assert admin.team_results(match(1, 3, 3, 3, 1)) == []
+
+
+def test_rebuild_counts_streaks_in_match_date_order(admin, written):
+    # Матч от 3-го числа завершён последним, но в серию должен попасть между 2-м и 4-м
+    cur = FakeCursor([match(1, 1, 2, 1, 1), match(2, 1, 2, 1, 2), match(3, 1, 2, 1, 4), match(4, 1, 2, 2, 3)])
+
+    assert admin.rebuild_team_stats(cur) == {'teams': 2, 'matches': 4}
+    assert team_stats(written) == {1: (4, 3, 1, 0, 1, 2), 2: (4, 1, 3, 0, -1, 1)}
+    assert "UPDATE matches SET stats_applied = (status = 'completed')" in cur.executed
+
+
+def test_rebuild_draw_resets_streak(admin, written):
+    cur = FakeCursor([match(1, 1, 2, 1, 1), match(2, 1, 2, 1, 2), match(3, 1, 2, None, 3)])
+
+    admin.rebuild_team_stats(cur)
+
+    assert team_stats(written) == {1: (3, 2, 0, 1, 0, 2), 2: (3, 0, 2, 1, 0, 0)}
+
+
+def test_rebuild_team_without_opponent_has_no_head_to_head(admin, written):
+    cur = FakeCursor([match(1, 1, None, 1, 1)])
+
+    admin.rebuild_team_stats(cur)
+
+    assert team_stats(written) == {1: (1, 1, 0, 0, 1, 1)}
+    assert 'team_head_to_head' not in written
+
+
+def test_partial_rebuild_writes_only_requested_teams(admin, written):
+    cur = FakeCursor([match(1, 1, 2, 1, 1), match(2, 2, 3, 3, 2), match(3, 3, 4, 4, 3)])
+
+    assert admin.rebuild_team_stats(cur, [2]) == {'teams': 1, 'matches': 2}
+    assert team_stats(written) == {2: (2, 0, 2, 0, -2, 0)}
+    assert {row[0] for row in written['team_match_type_stats']} == {2}
+    assert {row[:2] for row in written['team_head_to_head']} == {(1, 2), (2, 1), (2, 3), (3, 2)}
+    assert not any('TRUNCATE' in sql or 'stats_applied' in sql for sql in cur.executed)